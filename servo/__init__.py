@@ -47,5 +47,4 @@ from .types.slo import *
 from .utilities import *
 
 # Resolve forward references
-servo.events.EventResult.update_forward_refs()
 servo.events.EventHandler.update_forward_refs()
@@ -4,7 +4,17 @@ import abc
 import copy
 from datetime import datetime, timedelta
 import enum
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+import weakref
+from typing import (
+    Any,
+    AsyncContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 import backoff
 import curlify2
@@ -165,6 +175,33 @@ class CommandResponse(pydantic.BaseModel):
         }
 
 
+# NOTE: Shared clients are held off the instances (keyed by id) so that Pydantic
+# doesn't see additional attributes and unhashable models are supported
+_shared_api_clients: Dict[
+    int, Tuple[Dict[str, Any], httpx.AsyncClient, weakref.finalize]
+] = {}
+
+
+class _SharedAsyncClient:
+    """Lends out a long-lived `httpx.AsyncClient` that is not closed when the context exits."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:  # noqa: D107
+        self._client = client
+
+    async def __aenter__(self) -> httpx.AsyncClient:
+        return self._client
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        # NOTE: The shared client is only closed via `Mixin.close_api_client`
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
 class Mixin(abc.ABC):
     """Provides functionality for interacting with the Opsani API via httpx.
 
@@ -189,9 +226,45 @@ class Mixin(abc.ABC):
         """
         ...
 
-    def api_client(self, **kwargs) -> httpx.AsyncClient:
-        """Return an asynchronous client for interacting with the Opsani API."""
-        return httpx.AsyncClient(**{**self.api_client_options, **kwargs})
+    def api_client(self, **kwargs) -> AsyncContextManager[httpx.AsyncClient]:
+        """Return an asynchronous client for interacting with the Opsani API.
+
+        When a shared client has been opened via `open_api_client` and the client
+        options are unchanged, the shared client is returned so that connections
+        are reused across requests. Exiting the context of the shared client or
+        calling `aclose` on it does not close it. Otherwise a new client is
+        returned.
+        """
+        options = self.api_client_options
+        if not kwargs and (entry := _shared_api_clients.get(id(self))):
+            shared_options, client, _ = entry
+            if shared_options == options and not client.is_closed:
+                return _SharedAsyncClient(client)
+
+        return httpx.AsyncClient(**{**options, **kwargs})
+
+    def open_api_client(self) -> None:
+        """Open an asynchronous API client shared across calls to `api_client`.
+
+        The shared client must be released by awaiting `close_api_client`.
+        """
+        if id(self) in _shared_api_clients:
+            return
+
+        options = self.api_client_options
+        finalizer = weakref.finalize(self, _shared_api_clients.pop, id(self), None)
+        _shared_api_clients[id(self)] = (
+            options,
+            httpx.AsyncClient(**options),
+            finalizer,
+        )
+
+    async def close_api_client(self) -> None:
+        """Close the shared asynchronous API client, if any."""
+        if entry := _shared_api_clients.pop(id(self), None):
+            _, client, finalizer = entry
+            finalizer.detach()
+            await client.aclose()
 
     def api_client_sync(self, **kwargs) -> httpx.Client:
         """Return a synchronous client for interacting with the Opsani API."""
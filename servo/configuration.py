@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 import abc
+import dataclasses
+import datetime
 import enum
 import inspect
 import json
+import math
 import pathlib
 import re
+import uuid
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+import orjson
 import pydantic
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 import servo.logging
 import servo.types
+import servo.types.core
 from servo import types
 
 __all__ = [
@@ -127,6 +140,8 @@ class Optimizer(pydantic.BaseSettings):
 
 DEFAULT_TITLE = "Base Connector Configuration Schema"
 
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
     """
@@ -154,7 +169,7 @@ class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
 
         If the file does not contain a valid configuration, a `ValidationError` will be raised.
         """
-        configs = yaml.load_all(file.read_text(), Loader=yaml.FullLoader)
+        configs = yaml.load_all(file.read_text(), Loader=_YamlLoader)
         config_objs = []
 
         for config in configs:
@@ -190,7 +205,7 @@ class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
         # Default prefix
         prefix = cls.__config__.env_prefix
         if prefix == "":
-            prefix = re.sub(r"(?<!^)(?=[A-Z])", "_", base_name).upper() + "_"
+            prefix = _CAMEL_SPLIT_RE.sub("_", base_name).upper() + "_"
 
         for name, field in cls.__fields__.items():
             field.field_info.extra["env_names"] = {f"{prefix}{name}".upper()}
@@ -211,8 +226,29 @@ class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
         """
         Generate a YAML representation of the configuration.
 
-        Arguments are passed through to the Pydantic `BaseModel.json` method.
+        Arguments are passed through to the Pydantic `BaseModel.json` method. Values are
+        encoded exactly as they would be for JSON output, but when the model uses the default
+        servo JSON serializer the intermediate JSON string is skipped.
         """
+        if self.__config__.json_dumps is servo.types.core._orjson_dumps:
+            config_dict = self.dict(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                skip_defaults=skip_defaults,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+            if self.__custom_root_type__:
+                config_dict = config_dict[pydantic.utils.ROOT_KEY]
+
+            return yaml.dump(
+                _json_primitives(config_dict, encoder or self.__json_encoder__),
+                Dumper=_YamlDumper,
+                sort_keys=dumps_kwargs.get("sort_keys", False),
+            )
+
         # NOTE: We have to serialize through JSON first (not all fields serialize directly to YAML)
         config_json = self.json(
             include=include,
@@ -225,7 +261,12 @@ class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
             encoder=encoder,
             **dumps_kwargs,
         )
-        return yaml.dump(json.loads(config_json), sort_keys=False)
+        try:
+            config_obj = orjson.loads(config_json)
+        except orjson.JSONDecodeError:
+            # NOTE: orjson is strict JSON, fall back for NaN/Infinity and big integers
+            config_obj = json.loads(config_json)
+        return yaml.dump(config_obj, Dumper=_YamlDumper, sort_keys=False)
 
     @staticmethod
     def json_encoders(
@@ -247,6 +288,33 @@ class AbstractBaseConfiguration(pydantic.BaseSettings, servo.logging.Mixin):
         title = DEFAULT_TITLE
 
 
+def _json_primitives(value: Any, default: Callable[[Any], Any]) -> Any:
+    """Return the JSON primitives that `servo.types.core._orjson_dumps` would serialize the value as."""
+    value_type = type(value)
+    if value_type is float and not math.isfinite(value):
+        return None  # NOTE: orjson serializes NaN and Infinity as null
+    elif value is None or value_type in (str, int, float, bool):
+        return value
+    elif value_type is dict:
+        return {k: _json_primitives(v, default) for k, v in value.items()}
+    elif value_type in (list, tuple):
+        return [_json_primitives(v, default) for v in value]
+    elif isinstance(value, enum.Enum):
+        return _json_primitives(value.value, default)
+    elif isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, uuid.UUID):
+        return str(value)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _json_primitives(getattr(value, f.name), default)
+            for f in dataclasses.fields(value)
+        }
+
+    # NOTE: Subclasses of builtin types are passed through to the default encoder
+    return _json_primitives(servo.types.core._orjson_default(value, default), default)
+
+
 class BaseConfiguration(AbstractBaseConfiguration):
     """
     BaseConfiguration is the base configuration class for Opsani Servo Connectors.
@@ -10,8 +10,10 @@ from __future__ import annotations
 import abc
 import contextlib
 import contextvars
+import functools
 import importlib
 import re
+import weakref
 from typing import (
     Any,
     ClassVar,
@@ -21,11 +23,10 @@ from typing import (
     Set,
     Tuple,
     Type,
+    TYPE_CHECKING,
     get_type_hints,
 )
 
-import loguru
-import pkg_resources
 import pydantic
 
 import servo.api
@@ -37,6 +38,10 @@ import servo.telemetry
 import servo.utilities.associations
 from servo.types import *
 
+if TYPE_CHECKING:
+    import loguru
+    import pkg_resources
+
 __all__ = [
     "BaseConnector",
     "current_connector",
@@ -57,6 +62,20 @@ def current_connector() -> Optional["BaseConnector"]:
 
 _connector_subclasses: Set[Type["BaseConnector"]] = set()
 
+# Maps default names, class names, and qualified names onto connector classes
+_connector_name_index: Dict[str, Type["BaseConnector"]] = {}
+
+# Maps (group, name) of entry points onto the objects they resolved to
+_resolved_entry_points: Dict[Tuple[str, str], Any] = {}
+
+# NOTE: Held off the model so that Pydantic doesn't see additional attributes
+_api_headers_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+_NAME_RE = re.compile(r"[0-9a-zA-Z\-_/\.]{3,128}")
+_ACRONYM_RE = re.compile(r"^[A-Z]+$")
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_CONNECTOR_SUFFIX_RE = re.compile(r"Connector$")
+
 
 # NOTE: Initialize mixins first to control initialization graph
 class BaseConnector(
@@ -150,6 +169,7 @@ class BaseConnector(
         if not cls.__default_name__:
             if name := _name_for_connector_class(cls):
                 cls.__default_name__ = name
+                _connector_name_index[name] = cls
             else:
                 raise ValueError(
                     f"A default connector name could not be constructed for class '{cls}'"
@@ -160,7 +180,7 @@ class BaseConnector(
     @classmethod
     def _validate_name(cls, v):
         assert bool(
-            re.match("^[0-9a-zA-Z-_/\\.]{3,128}$", v)
+            _NAME_RE.fullmatch(v)
         ), "names may only contain alphanumeric characters, hyphens, slashes, periods, and underscores"
         return v
 
@@ -200,6 +220,9 @@ class BaseConnector(
         cls.full_name = cls.__name__.replace("Connector", " Connector")
         cls.version = Version.parse("0.0.0")
         cls.__default_name__ = _name_for_connector_class(cls)
+        for name in (cls.__default_name__, cls.__name__, cls.__qualname__):
+            if name:
+                _connector_name_index[name] = cls
 
     def __init__(
         self,
@@ -215,12 +238,31 @@ class BaseConnector(
         )
 
     def __hash__(self):  # noqa: D105
-        return hash(
-            (
-                self.name,
-                id(self),
+        # NOTE: Identity already makes the hash unique, the name adds nothing
+        return id(self)
+
+    @property
+    def api_headers(self) -> Dict[str, str]:
+        """Return the HTTP headers for requests to the Opsani API.
+
+        The headers are cached and only rebuilt when the optimizer token changes.
+        """
+        if not self.optimizer:
+            raise RuntimeError(
+                f"cannot construct API headers: optimizer is not configured"
             )
-        )
+        token = self.optimizer.token.get_secret_value()
+        cached = _api_headers_cache.get(self)
+        if cached and cached[0] == token:
+            return cached[1]
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "User-Agent": servo.api.user_agent(),
+            "Content-Type": "application/json",
+        }
+        _api_headers_cache[self] = (token, headers)
+        return headers
 
     @property
     def api_client_options(self) -> Dict[str, Any]:  # noqa: D105
@@ -230,11 +272,7 @@ class BaseConnector(
             )
         return {
             "base_url": self.optimizer.url,
-            "headers": {
-                "Authorization": f"Bearer {self.optimizer.token.get_secret_value()}",
-                "User-Agent": servo.api.user_agent(),
-                "Content-Type": "application/json",
-            },
+            "headers": self.api_headers,
             "proxies": self._global_config.proxies,
             "timeout": self._global_config.timeouts,
             "verify": self._global_config.ssl_verify,
@@ -281,6 +319,7 @@ def metadata(
                         f"Connector names given as tuples must contain exactly 2 elements: full name and alias"
                     )
                 cls.name, cls.__default_name__ = name
+                _connector_name_index[cls.__default_name__] = cls
             else:
                 cls.name = name
         if description:
@@ -315,13 +354,13 @@ def _name_for_connector_class(cls: Type[BaseConnector]) -> Optional[str]:
     for name in (cls.name, cls.__name__):
         if not name:
             continue
-        name = re.sub(r"Connector$", "", name)
-        if re.match(r"^[A-Z]+$", name):
+        name = _CONNECTOR_SUFFIX_RE.sub("", name)
+        if _ACRONYM_RE.match(name):
             # Handle case where the name is an acronym (e.g. 'OLAS') => 'olas'
             name = name.lower()
         else:
             # Handle case where the name is CamelCase (e.g., 'DataDog') => 'data_dog'
-            name = re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+            name = _CAMEL_SPLIT_RE.sub("_", name).lower()
         if name != "":
             return name
     return None
@@ -339,11 +378,18 @@ class ConnectorLoader:
         self.group = group
 
     def iter_entry_points(self) -> Generator[pkg_resources.EntryPoint, None, None]:
+        # NOTE: pkg_resources scans every installed distribution on import, defer it until needed
+        import pkg_resources
+
         yield from pkg_resources.iter_entry_points(group=self.group, name=None)
 
     def load(self) -> Generator[Any, None, None]:
         for entry_point in self.iter_entry_points():
-            yield entry_point.resolve()
+            key = (self.group, entry_point.name)
+            if key not in _resolved_entry_points:
+                _resolved_entry_points[key] = entry_point.resolve()
+
+            yield _resolved_entry_points[key]
 
 
 def _normalize_connectors(connectors: Optional[Iterable]) -> Optional[Iterable]:
@@ -448,39 +494,43 @@ def _connector_class_from_string(connector: str) -> Optional[Type["BaseConnector
     if not isinstance(connector, str):
         return None
 
-    # Check for an existing class in the namespace
-    # FIXME: This symbol lookup doesn't seem solid
-    connector_class = globals().get(connector, None)
-    try:
-        connector_class = (
-            eval(connector) if connector_class is None else connector_class
-        )
-    except Exception:
-        pass
-
-    if _validate_class(connector_class):
-        return connector_class
-
     # Check if the string is an identifier for a connector
-    for connector_class in _connector_subclasses:
-        if connector == connector_class.__default_name__ or connector in [
+    # NOTE: Every connector class registers its names on definition so there
+    # is no need to evaluate the string against the module namespace
+    if connector_class := _connector_name_index.get(connector):
+        # Guard against stale entries for names that have since been reassigned
+        if connector in (
+            connector_class.__default_name__,
             connector_class.__name__,
             connector_class.__qualname__,
-        ]:
+        ):
             return connector_class
 
+        # The indexed class has been renamed, find a class still answering to the name
+        for connector_class in _connector_subclasses:
+            if connector in (
+                connector_class.__default_name__,
+                connector_class.__name__,
+                connector_class.__qualname__,
+            ):
+                _connector_name_index[connector] = connector_class
+                return connector_class
+
     # Try to load it as a module path
     if "." in connector:
-        module_path, class_name = connector.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        if hasattr(module, class_name):
-            connector_class = getattr(module, class_name)
-            if _validate_class(connector_class):
-                return connector_class
+        connector_class = _import_attribute(*connector.rsplit(".", 1))
+        if _validate_class(connector_class):
+            return connector_class
 
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _import_attribute(module_path: str, name: str) -> Optional[Any]:
+    module = importlib.import_module(module_path)
+    return getattr(module, name, None)
+
+
 def _validate_class(connector: type) -> bool:
     if connector is None or not isinstance(connector, type):
         return False
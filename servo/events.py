@@ -3,10 +3,11 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import contextvars
+import dataclasses
 import datetime
 import enum
-import functools
 import inspect
+import itertools
 import sys
 import types
 import weakref
@@ -16,9 +17,12 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -289,28 +293,28 @@ class EventHandler(pydantic.BaseModel):
     kwargs: Dict[str, Any]
     connector_type: Optional[Type["Mixin"]] = None  # NOTE: Optional due to decorator
     handler: EventCallable
+    is_coroutine: bool = False
 
     def __str__(self):
         return f"{self.connector_type}({self.preposition}:{self.event}->{self.handler})"
 
 
-class EventResult(pydantic.BaseModel):
+@dataclasses.dataclass
+class EventResult:
     """
     Encapsulates the result of a dispatched Connector event
     """
 
+    # NOTE: A result is allocated for every handler invocation, slots keep them lean
+    __slots__ = ("event", "preposition", "handler", "connector", "created_at", "value")
+
     event: Event
     preposition: Preposition
     handler: EventHandler
     connector: "Mixin"
-    created_at: datetime.datetime = None
+    created_at: datetime.datetime
     value: Any
 
-    @pydantic.validator("created_at", pre=True, always=True)
-    @classmethod
-    def set_created_at_now(cls, v):
-        return v or datetime.datetime.now()
-
 
 ##
 # Event registry
@@ -331,6 +335,11 @@ def get_event(name: str, default=...) -> Optional[Event]:
         return _events.get(name, default)
 
 
+def _coerce_event(event: Union[Event, str]) -> Event:
+    """Resolve an event name into the registered Event, passing Event objects through."""
+    return _events[event] if isinstance(event, str) else event
+
+
 def create_event(
     name: str,
     signature: Union[Callable[[Any], Awaitable], inspect.Signature],
@@ -577,7 +586,11 @@ def event_handler(
 
         # Annotate the function for processing later, see Connector.__init_subclass__
         fn.__event_handler__ = EventHandler(
-            event=event, preposition=preposition, handler=fn, kwargs=kwargs
+            event=event,
+            preposition=preposition,
+            handler=fn,
+            kwargs=kwargs,
+            is_coroutine=asyncio.iscoroutinefunction(fn),
         )
         return fn
 
@@ -592,17 +605,34 @@ def __after_handler(self, results: List[EventResult]) -> None:
 _is_base_class_defined = False
 
 
+def _index_event_handler(
+    index: Dict[Tuple[str, Preposition], List[EventHandler]], handler: EventHandler
+) -> None:
+    index.setdefault((handler.event.name, handler.preposition), []).append(handler)
+
+
 class Metaclass(pydantic.main.ModelMetaclass):
     def __new__(mcs, name, bases, namespace, **kwargs):
         # Decorate the class with an event registry, inheriting from our parent connectors
-        event_handlers: List[EventHandler] = []
+        # NOTE: Each base already carries its ancestors' handlers, so dedupe by
+        # identity to avoid registering handlers shared via a diamond twice
+        inherited_handlers: Dict[int, EventHandler] = {}
 
         for base in reversed(bases):
             if _is_base_class_defined and issubclass(base, Mixin) and base is not Mixin:
-                event_handlers.extend(base.__event_handlers__)
+                for handler in base.__event_handlers__:
+                    inherited_handlers.setdefault(id(handler), handler)
+
+        event_handlers: List[EventHandler] = list(inherited_handlers.values())
+
+        # Index the handlers by event name and preposition for constant time lookups during dispatch
+        event_handler_index: Dict[Tuple[str, Preposition], List[EventHandler]] = {}
+        for handler in event_handlers:
+            _index_event_handler(event_handler_index, handler)
 
         new_namespace = {
             "__event_handlers__": event_handlers,
+            "__event_handler_index__": event_handler_index,
             **{n: v for n, v in namespace.items()},
         }
 
@@ -623,7 +653,12 @@ class Mixin:
                     )
 
                 handler.connector_type = cls
-                cls.__event_handlers__.append(handler)
+                cls._register_event_handler(handler)
+
+    @classmethod
+    def _register_event_handler(cls, handler: EventHandler) -> None:
+        cls.__event_handlers__.append(handler)
+        _index_event_handler(cls.__event_handler_index__, handler)
 
     def __init__(
         self,
@@ -666,13 +701,11 @@ class Mixin:
         """
         Returns True if the Connector processes the specified event (before, on, or after).
         """
-        if isinstance(event, str):
-            event = get_event(event)
-
-        handlers = list(
-            filter(lambda handler: handler.event == event, cls.__event_handlers__)
+        event = _coerce_event(event)
+        return any(
+            (event.name, preposition) in cls.__event_handler_index__
+            for preposition in (Preposition.before, Preposition.on, Preposition.after)
         )
-        return len(handlers) > 0
 
     @classmethod
     def get_event_handlers(
@@ -681,16 +714,16 @@ class Mixin:
         """
         Retrieves the event handlers for the given event and preposition.
         """
-        if isinstance(event, str):
-            event = get_event(event, None)
-
-        return list(
-            filter(
-                lambda handler: handler.event == event
-                and handler.preposition & preposition,
-                cls.__event_handlers__,
-            )
-        )
+        event_name = event if isinstance(event, str) else event.name
+        if preposition.flag:
+            return list(cls.__event_handler_index__.get((event_name, preposition), ()))
+
+        # Preserve declaration order across prepositions for flag sets
+        return [
+            handler
+            for handler in cls.__event_handlers__
+            if handler.event.name == event_name and handler.preposition & preposition
+        ]
 
     @classmethod
     def add_event_handler(
@@ -706,7 +739,7 @@ class Mixin:
         d_callable = event_handler(event.name, preposition, **kwargs)(callable)
         handler = d_callable.__event_handler__
         handler.connector_type = cls
-        cls.__event_handlers__.append(handler)
+        cls._register_event_handler(handler)
         return handler
 
     @property
@@ -765,22 +798,23 @@ class Mixin:
         Returns:
             A list of event result objects detailing the results returned.
         """
-        connectors: List[Mixin] = self.__connectors__
-        event = get_event(event) if isinstance(event, str) else event
+        connectors: Iterable[Mixin] = self.__connectors__
+        event = _coerce_event(event)
 
         if include is not None:
-            included_names = list(
-                map(lambda c: c if isinstance(c, str) else c.name, include)
+            included_names = frozenset(
+                c if isinstance(c, str) else c.name for c in include
             )
-            connectors = list(filter(lambda c: c.name in included_names, connectors))
+            connectors = (c for c in connectors if c.name in included_names)
 
         if exclude is not None:
-            excluded_names = list(
-                map(lambda c: c if isinstance(c, str) else c.name, exclude)
-            )
-            connectors = list(
-                filter(lambda c: c.name not in excluded_names, connectors)
+            excluded_names = frozenset(
+                c if isinstance(c, str) else c.name for c in exclude
             )
+            connectors = (c for c in connectors if c.name not in excluded_names)
+
+        # NOTE: Resolved once, every preposition phase iterates the same tuple
+        connectors = tuple(connectors)
 
         # Validate that we are dispatching to connectors that are in our graph
         if not set(connectors).issubset(self.__connectors__):
@@ -830,12 +864,15 @@ class Mixin:
                 results: List[EventResult] = []
                 for event_handler in event_handlers:
                     # NOTE: Explicit kwargs take precendence over those defined during handler declaration
-                    merged_kwargs = event_handler.kwargs.copy()
-                    merged_kwargs.update(kwargs)
+                    merged_kwargs = (
+                        {**event_handler.kwargs, **kwargs}
+                        if event_handler.kwargs
+                        else kwargs
+                    )
                     try:
                         method = types.MethodType(event_handler.handler, self)
                         async with event.on_handler_context_manager(self):
-                            if asyncio.iscoroutinefunction(method):
+                            if event_handler.is_coroutine:
                                 value = await asyncio.create_task(
                                     method(*args, **merged_kwargs),
                                     name=f"{preposition}:{event}",
@@ -848,6 +885,7 @@ class Mixin:
                             event=event,
                             preposition=preposition,
                             handler=event_handler,
+                            created_at=datetime.datetime.now(),
                             value=value,
                         )
                         results.append(result)
@@ -874,6 +912,7 @@ class Mixin:
                             event=event,
                             preposition=preposition,
                             handler=event_handler,
+                            created_at=datetime.datetime.now(),
                             value=error,
                         )
 
@@ -892,7 +931,7 @@ class _DispatchEvent:
     def __init__(
         self,
         event: Union[Event, str],
-        connectors: List[Mixin],
+        connectors: Tuple[Mixin, ...],
         parent: servo.pubsub.Mixin,
         args: List[Any],
         first: bool = False,
@@ -982,6 +1021,11 @@ class _DispatchEvent:
         # Iterate through the channel
         return self._channel.__aiter__()
 
+    def _responders(self, preposition: Preposition) -> Iterator[Mixin]:
+        # NOTE: Most connectors do not handle most events, skip them without a call
+        key = (self.event.name, preposition)
+        return (c for c in self._connectors if c.__event_handler_index__.get(key))
+
     async def run(self) -> List[EventResult]:
         """Run the Event dispatch operation to completion and return results."""
         if self.done:
@@ -992,28 +1036,46 @@ class _DispatchEvent:
 
         # Invoke the before event handlers
         if self._prepositions & Preposition.before:
-            for connector in self._connectors:
+            # NOTE: Handlers run in order within a connector but connectors are
+            # independent of each other, so run them concurrently
+            connectors = tuple(self._responders(Preposition.before))
+            before_handlers = [
+                connector.run_event_handlers(
+                    self.event,
+                    Preposition.before,
+                    *self._args,
+                    return_exceptions=False,
+                    **self._kwargs,
+                )
+                for connector in connectors
+            ]
+            if len(before_handlers) == 1:
                 try:
-                    results = await connector.run_event_handlers(
-                        self.event,
-                        Preposition.before,
-                        *self._args,
-                        return_exceptions=False,
-                        **self._kwargs,
-                    )
-
+                    outcomes = [await before_handlers[0]]
                 except servo.errors.EventCancelledError as error:
+                    outcomes = [error]
+            else:
+                outcomes = await asyncio.gather(
+                    *before_handlers, return_exceptions=True
+                )
+
+            for connector, outcome in zip(connectors, outcomes):
+                if isinstance(outcome, servo.errors.EventCancelledError):
                     # Return an empty result set
                     servo.logger.warning(
-                        f'event cancelled by before event handler on connector "{connector.name}": {error}'
+                        f'event cancelled by before event handler on connector "{connector.name}": {outcome}'
                     )
                     return []
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+
+                results = outcome
 
         # Invoke the on event handlers and gather results
         if self._prepositions & Preposition.on:
             if self._first:
                 # A single responder has been requested
-                for connector in self._connectors:
+                for connector in self._responders(Preposition.on):
                     results = await connector.run_event_handlers(
                         self.event,
                         Preposition.on,
@@ -1025,33 +1087,28 @@ class _DispatchEvent:
                         break
             else:
                 group = asyncio.gather(
-                    *list(
-                        map(
-                            lambda c: c.run_event_handlers(
-                                self.event,
-                                Preposition.on,
-                                return_exceptions=self._return_exceptions,
-                                *self._args,
-                                **self._kwargs,
-                            ),
-                            self._connectors,
+                    *(
+                        c.run_event_handlers(
+                            self.event,
+                            Preposition.on,
+                            *self._args,
+                            return_exceptions=self._return_exceptions,
+                            **self._kwargs,
                         )
+                        for c in self._responders(Preposition.on)
                     ),
                 )
                 results = await group
-                results = list(filter(lambda r: r is not None, results))
-                results = functools.reduce(lambda x, y: x + y, results, [])
+                results = list(
+                    itertools.chain.from_iterable(r for r in results if r is not None)
+                )
 
         # Invoke the after event handlers
         if self._prepositions & Preposition.after:
             await asyncio.gather(
-                *list(
-                    map(
-                        lambda c: c.run_event_handlers(
-                            self.event, Preposition.after, results
-                        ),
-                        self._connectors,
-                    )
+                *(
+                    c.run_event_handlers(self.event, Preposition.after, results)
+                    for c in self._responders(Preposition.after)
                 )
             )
 
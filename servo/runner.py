@@ -274,6 +274,7 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
         self._running = True
 
         _set_current_servo(self.servo)
+        self.open_api_client()
         await self.servo.startup()
         self.logger.info(
             f"Servo started with {len(self.servo.connectors)} active connectors [{self.optimizer.id} @ {self.optimizer.url or self.optimizer.base_url}]"
@@ -335,6 +336,8 @@ class ServoRunner(pydantic.BaseModel, servo.logging.Mixin, servo.api.Mixin):
                 await self._post_event(servo.api.Events.goodbye, dict(reason=reason))
         except Exception:
             self.logger.exception(f"Exception occurred during GOODBYE request")
+        finally:
+            await self.close_api_client()
 
 
 class AssemblyRunner(pydantic.BaseModel, servo.logging.Mixin):
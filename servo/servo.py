@@ -246,6 +246,10 @@ class Servo(servo.connector.BaseConnector):
 
         self._running = True
 
+        for connector in self.all_connectors:
+            if connector.optimizer:
+                connector.open_api_client()
+
         await self.dispatch_event(
             Events.startup, _prepositions=servo.events.Preposition.on
         )
@@ -266,6 +270,8 @@ class Servo(servo.connector.BaseConnector):
         if self.pubsub_exchange.running:
             await self.pubsub_exchange.shutdown()
 
+        await self.close_api_client()
+
         self._running = False
 
     @property
@@ -334,6 +340,9 @@ class Servo(servo.connector.BaseConnector):
 
         # Start the connector if we are running
         if self.is_running:
+            if connector.optimizer:
+                connector.open_api_client()
+
             await self.dispatch_event(
                 Events.startup,
                 include=[connector],
@@ -380,6 +389,8 @@ class Servo(servo.connector.BaseConnector):
         self.connectors.remove(connector_)
         self.__connectors__.remove(connector_)
 
+        await connector_.close_api_client()
+
         # Remove from the pub/sub exchange
         connector_.cancel_subscribers()
         connector_.cancel_publishers()
@@ -51,14 +51,7 @@ def _orjson_dumps(
         option |= orjson.OPT_SORT_KEYS
 
     def default_handler(obj) -> Any:
-        # TODO hook OpsaniRepr into this as well
-        try:
-            if isinstance(obj, HumanReadable):
-                return obj.human_readable()
-
-            return default(obj)
-        except TypeError:
-            return orjson.dumps(obj).decode()
+        return _orjson_default(obj, default)
 
     try:
         return orjson.dumps(v, default=default_handler, option=option).decode()
@@ -66,6 +59,18 @@ def _orjson_dumps(
         raise err
 
 
+def _orjson_default(obj: Any, default: Callable[[Any], Any]) -> Any:
+    """Encodes an object that `orjson` cannot serialize natively (including subclasses of builtin types)."""
+    # TODO hook OpsaniRepr into this as well
+    try:
+        if isinstance(obj, HumanReadable):
+            return obj.human_readable()
+
+        return default(obj)
+    except TypeError:
+        return orjson.dumps(obj).decode()
+
+
 DEFAULT_JSON_ENCODERS = {
     pydantic.SecretStr: lambda v: v.get_secret_value() if v else None,
 }
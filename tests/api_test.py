@@ -152,3 +152,56 @@ def test_parse_command_response_including_units_control(payload, validator) -> N
 
     obj = parse_obj_as(Union[CommandResponse, Status], payload)
     validator(obj)
+
+
+class TestSharedAPIClient:
+    @pytest.fixture
+    def api_mixin(self, optimizer: servo.Optimizer) -> servo.api.Mixin:
+        class APIMixin(servo.api.Mixin):
+            @property
+            def api_client_options(self) -> dict:
+                return {"base_url": optimizer.url}
+
+        return APIMixin()
+
+    async def test_shared_client_is_reused(self, api_mixin: servo.api.Mixin) -> None:
+        api_mixin.open_api_client()
+        async with api_mixin.api_client() as client:
+            pass
+        assert not client.is_closed
+
+        async with api_mixin.api_client() as another_client:
+            assert another_client is client
+
+        await api_mixin.close_api_client()
+        assert client.is_closed
+
+    async def test_shared_client_is_not_closed_by_aclose(
+        self, api_mixin: servo.api.Mixin
+    ) -> None:
+        api_mixin.open_api_client()
+        shared_client = api_mixin.api_client()
+        await shared_client.aclose()
+        async with api_mixin.api_client() as client:
+            assert not client.is_closed
+
+        await api_mixin.close_api_client()
+        assert client.is_closed
+
+    async def test_closing_shared_client_detaches_finalizer(
+        self, api_mixin: servo.api.Mixin
+    ) -> None:
+        finalizers = []
+        for _ in range(3):
+            api_mixin.open_api_client()
+            finalizers.append(servo.api._shared_api_clients[id(api_mixin)][2])
+            await api_mixin.close_api_client()
+
+        assert not any(finalizer.alive for finalizer in finalizers)
+
+    async def test_client_is_not_shared_unless_opened(
+        self, api_mixin: servo.api.Mixin
+    ) -> None:
+        async with api_mixin.api_client() as client:
+            pass
+        assert client.is_closed
@@ -73,3 +73,25 @@ def test_base_url_stripping() -> None:
         optimizer.url
         == "https://foo.opsani.com/accounts/dev.opsani.com/applications/awesome-app/"
     )
+
+
+def test_yaml_matches_json_round_trip() -> None:
+    import yaml
+
+    from servo.connectors.vegeta import VegetaConfiguration
+
+    config = VegetaConfiguration.generate()
+    assert config.yaml() == yaml.dump(json.loads(config.json()), sort_keys=False)
+
+
+def test_yaml_with_custom_json_dumps() -> None:
+    class CustomConfiguration(servo.BaseConfiguration):
+        name: str = "example"
+        ratio: float = float("nan")
+
+        class Config:
+            json_dumps = json.dumps
+
+    assert CustomConfiguration().yaml(exclude={"description"}) == (
+        "name: example\nratio: .nan\n"
+    )
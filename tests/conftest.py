@@ -2,7 +2,6 @@ import asyncio
 import builtins
 import contextlib
 import enum
-import json
 import os
 import pathlib
 import random
@@ -27,11 +26,15 @@ import fastapi
 import httpx
 import kubetest
 import kubetest.client
+import orjson
 import pytest
-import typer.testing
-import uvloop
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # libyaml is not available
+    from yaml import SafeDumper as YamlDumper
+
 import servo.cli
 import servo.connectors.kubernetes
 import tests.helpers
@@ -83,20 +86,36 @@ def event_loop_policy(request) -> str:
     return event_loop_policy
 
 
+@pytest.fixture(scope="session")
+def event_loop_policies() -> Dict[str, asyncio.AbstractEventLoopPolicy]:
+    """Return the event loop policy instances available to tests, keyed by name."""
+    import uvloop
+
+    return {
+        "default": asyncio.DefaultEventLoopPolicy(),
+        "uvloop": uvloop.EventLoopPolicy(),
+    }
+
+
 @pytest.fixture
-def event_loop(event_loop_policy: str) -> Iterator[asyncio.AbstractEventLoop]:
+def event_loop(
+    event_loop_policy: str,
+    event_loop_policies: Dict[str, asyncio.AbstractEventLoopPolicy],
+) -> Iterator[asyncio.AbstractEventLoop]:
     """Yield an instance of the event loop for each test case.
 
     The effective event loop policy is determined by the `event_loop_policy` fixture.
     """
-    if event_loop_policy == "default":
-        asyncio.set_event_loop_policy(None)
-    elif event_loop_policy == "uvloop":
-        uvloop.install()
-    else:
+    policy = event_loop_policies.get(event_loop_policy)
+    if policy is None:
         raise ValueError(f'invalid event loop policy: "{event_loop_policy}"')
 
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    # NOTE: pytest-asyncio resets the policy after every test so it is
+    # reinstalled each time, but the loop is bound up front so that the
+    # plugin does not create and discard a loop of its own
+    asyncio.set_event_loop_policy(policy)
+    loop = policy.new_event_loop()
+    policy.set_event_loop(loop)
     yield loop
     loop.close()
 
@@ -161,58 +180,6 @@ class Environment(str, enum.Enum):
             return []
 
 
-UNIT_INI = (
-    "unit: marks the test as a unit test. Unit tests are fast, highly localized, and "
-    "have no external dependencies. Tests without an explicit type mark are considered "
-    "unit tests for convenience."
-)
-INTEGRATION_INI = (
-    "integration: marks the test as an integration test. Integration tests have external "
-    "dependencies that can be orchestrated by the test suite. They are much slower than "
-    "unit tests but provide interaction with external components. "
-)
-SYSTEM_INI = (
-    "system: marks the test as system test. System tests are run in specific environments "
-    "and execute functionality end to end. They are very slow and resource intensive, but "
-    "are capable of verifying that the product meets requirements as specified from a user "
-    "perspective."
-)
-EVENT_LOOP_POLICY_INI = (
-    "event_loop_policy: marks async tests to run under a parametrized asyncio "
-    "runloop policy. There are two event loop policies available: default and uvloop. "
-    "The `default` policy is the standard event loop behavior provided with asyncio. "
-    "The `uvloop` policy is a high performance event loop. Certain tests may fail "
-    "due to interactions between uvloop and the pytest output capture mechanism. "
-    "The `event_loop_policy` fixture determines what event loop policy is registered "
-    "at runtime and respects the value of this marker."
-)
-MINIKUBE_PROFILE_INI = (
-    "minikube_profile: marks tests using minikube to run under the profile specified"
-    "in the first marker argument. Eg. pytest.mark.minikube_profile.with_args(MINIKUBE_PROFILE)"
-)
-ROLLOUT_MANIFEST_INI = (
-    "rollout_manifest: mark tests using argo rollouts to apply the manifest from"
-    "the specified path in the first marker argument. Eg."
-    '@pytest.mark.rollout_manifest.with_args("tests/manifests/opsani_dev/argo_rollouts/rollout.yaml")'
-)
-
-
-def pytest_configure(config) -> None:
-    """Register custom markers for use in the test suite."""
-    config.addinivalue_line("markers", UNIT_INI)
-    config.addinivalue_line("markers", INTEGRATION_INI)
-    config.addinivalue_line("markers", SYSTEM_INI)
-    config.addinivalue_line("markers", EVENT_LOOP_POLICY_INI)
-    config.addinivalue_line("markers", MINIKUBE_PROFILE_INI)
-    config.addinivalue_line("markers", ROLLOUT_MANIFEST_INI)
-
-    # Add generic description for all environments
-    for key, value in Environment.__members__.items():
-        config.addinivalue_line(
-            "markers", f"{key}: marks the test as runnable on {value}."
-        )
-
-
 def pytest_runtest_setup(item):
     # NOTE: If integration is selected but theres no kubeconfig, fail them clearly
     type_mark, _ = gather_marks_for_item(item)
@@ -251,13 +218,17 @@ def selected_types_for_item(item) -> Optional[List[TestType]]:
     return matches
 
 
+TEST_TYPE_NAMES = frozenset(TestType.names())
+ENVIRONMENT_IDS = frozenset(Environment.ids())
+
+
 def gather_marks_for_item(item) -> tuple:
     type_mark, env_marks = None, []
     for mark in item.iter_markers():
-        if type_mark is None and mark.name in TestType.names():
+        if type_mark is None and mark.name in TEST_TYPE_NAMES:
             # NOTE: Only the closest marker is relevant
             type_mark = mark
-        elif mark.name in Environment.ids():
+        elif mark.name in ENVIRONMENT_IDS:
             env_marks.append(mark)
 
     return (type_mark, env_marks)
@@ -270,47 +241,52 @@ def pytest_collection_modifyitems(config, items) -> None:
     integration and system tests unless opted in.
     """
 
+    # NOTE: Resolve options and marks once rather than for every item
+    asyncio_mark = pytest.mark.asyncio
+    unit_mark = pytest.mark.unit
+    env_parent_marks = {
+        name: [getattr(pytest.mark, env.name) for env in member.parents]
+        for name, member in Environment.__members__.items()
+        if member.parents
+    }
+    skip_marks = {
+        type_name: pytest.mark.skip(
+            reason=f"{type_name} tests not enabled. Run with --{type_name} to enable"
+        )
+        for type_name in (TestType.integration.value, TestType.system.value)
+        if not config.getoption(f"--{type_name}")
+    }
+
     selected_items = []
     deselected_items = []
     for item in items:
         # Set asyncio default marker
-        item.add_marker(pytest.mark.asyncio)
+        item.add_marker(asyncio_mark)
 
         # Consider any unmarked item as a unit test
         type_mark, env_marks = gather_marks_for_item(item)
         if not type_mark:
-            type_mark = pytest.mark.unit
+            type_mark = unit_mark
             item.add_marker(type_mark)
 
         # Add missing parent marks for environment selectors
         if env_marks:
-            for name, member in Environment.__members__.items():
-                if next(filter(lambda m: m.name == name, env_marks), None):
-                    for env in member.parents:
-                        mark = getattr(pytest.mark, env.name)
+            env_names = {m.name for m in env_marks}
+            for name, parent_marks in env_parent_marks.items():
+                if name in env_names:
+                    for mark in parent_marks:
                         item.add_marker(mark)
-                        env_marks.append(mark)
 
         # Handle CLI switches
         selected_types = selected_types_for_item(item)
         if selected_types is not None:
             if type_mark.name not in selected_types:
                 deselected_items.append(item)
-        else:
-            if (
-                type_mark.name == TestType.integration
-                and not config.getoption("--integration")
-            ) or (
-                type_mark.name == TestType.system and not config.getoption("--system")
-            ):
-                item.add_marker(
-                    pytest.mark.skip(
-                        reason=f"{type_mark.name} tests not enabled. Run with --{type_mark.name} to enable"
-                    )
-                )
+                continue
+        elif skip_mark := skip_marks.get(type_mark.name):
+            item.add_marker(skip_mark)
 
-        if item not in deselected_items:
-            selected_items.append(item)
+        selected_items.append(item)
 
     # Deselect any items accumulated. The items input array must be mutated in place
     items[:] = selected_items
@@ -318,8 +294,10 @@ def pytest_collection_modifyitems(config, items) -> None:
 
 
 @pytest.fixture()
-def cli_runner() -> typer.testing.CliRunner:
+def cli_runner() -> "typer.testing.CliRunner":
     """Return a runner for testing Typer CLI applications."""
+    import typer.testing
+
     return typer.testing.CliRunner(mix_stderr=False)
 
 
@@ -330,16 +308,10 @@ def servo_cli() -> servo.cli.ServoCLI:
 
 
 @pytest.fixture()
-def optimizer_env() -> Iterator[None]:
+def optimizer_env(monkeypatch: pytest.MonkeyPatch) -> None:
     """Add values for the OPSANI_OPTIMIZER and OPSANI_TOKEN variables to the environment."""
-    os.environ.update(
-        {"OPSANI_OPTIMIZER": "dev.opsani.com/servox", "OPSANI_TOKEN": "123456789"}
-    )
-    try:
-        yield
-    finally:
-        os.environ.pop("OPSANI_OPTIMIZER", None)
-        os.environ.pop("OPSANI_TOKEN", None)
+    monkeypatch.setenv("OPSANI_OPTIMIZER", "dev.opsani.com/servox")
+    monkeypatch.setenv("OPSANI_TOKEN", "123456789")
 
 
 @pytest.fixture()
@@ -356,46 +328,34 @@ def servo_yaml(tmp_path: pathlib.Path) -> pathlib.Path:
     return config_path
 
 
-@pytest.fixture()
-def stub_servo_yaml(tmp_path: pathlib.Path) -> pathlib.Path:
-    """Return the path to a servo config file set up for running stub connectors from the test helpers."""
-    config_path: pathlib.Path = tmp_path / "servo.yaml"
+@pytest.fixture(scope="session")
+def stub_servo_yaml_text() -> str:
+    """Return the text of a servo config file set up for running stub connectors from the test helpers."""
     settings = servo.BaseConfiguration()
-    measure_config_json = json.loads(
-        json.dumps(
-            settings.dict(
-                by_alias=True,
-            )
-        )
-    )
+    measure_config_json = settings.dict(by_alias=True)
     config = {
         "connectors": ["measure", "adjust"],
         "measure": measure_config_json,
         "adjust": {},
     }
-    config = yaml.dump(config)
-    config_path.write_text(config)
-    return config_path
+    return yaml.dump(config, Dumper=YamlDumper)
 
 
 @pytest.fixture()
-def stub_multiservo_yaml(tmp_path: pathlib.Path) -> pathlib.Path:
-    """Return the path to a servo config file set up for multi-servo execution."""
+def stub_servo_yaml(tmp_path: pathlib.Path, stub_servo_yaml_text: str) -> pathlib.Path:
+    """Return the path to a servo config file set up for running stub connectors from the test helpers."""
     config_path: pathlib.Path = tmp_path / "servo.yaml"
+    config_path.write_text(stub_servo_yaml_text)
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def stub_multiservo_yaml_text() -> str:
+    """Return the text of a servo config file set up for multi-servo execution."""
     settings = tests.helpers.BaseConfiguration()
-    measure_config_json = json.loads(
-        json.dumps(
-            settings.dict(
-                by_alias=True,
-            )
-        )
-    )
+    measure_config_json = settings.dict(by_alias=True)
     optimizer1 = servo.Optimizer(id="dev.opsani.com/multi-servox-1", token="123456789")
-    optimizer1_config_json = json.loads(
-        optimizer1.json(
-            by_alias=True,
-        )
-    )
+    optimizer1_config_json = orjson.loads(optimizer1.json(by_alias=True))
     config1 = {
         "optimizer": optimizer1_config_json,
         "connectors": ["measure", "adjust"],
@@ -403,26 +363,35 @@ def stub_multiservo_yaml(tmp_path: pathlib.Path) -> pathlib.Path:
         "adjust": {},
     }
     optimizer2 = servo.Optimizer(id="dev.opsani.com/multi-servox-2", token="987654321")
-    optimizer2_config_json = json.loads(
-        optimizer2.json(
-            by_alias=True,
-        )
-    )
+    optimizer2_config_json = orjson.loads(optimizer2.json(by_alias=True))
     config2 = {
         "optimizer": optimizer2_config_json,
         "connectors": ["measure", "adjust"],
         "measure": measure_config_json,
         "adjust": {},
     }
-    config_yaml = yaml.dump_all([config1, config2])
-    config_path.write_text(config_yaml)
+    return yaml.dump_all([config1, config2], Dumper=YamlDumper)
+
+
+@pytest.fixture()
+def stub_multiservo_yaml(
+    tmp_path: pathlib.Path, stub_multiservo_yaml_text: str
+) -> pathlib.Path:
+    """Return the path to a servo config file set up for multi-servo execution."""
+    config_path: pathlib.Path = tmp_path / "servo.yaml"
+    config_path.write_text(stub_multiservo_yaml_text)
     return config_path
 
 
 # Ensure no files from the working copy and found
 @pytest.fixture(autouse=True)
 def run_from_tmp_path(tmp_path: pathlib.Path) -> None:
-    """Change the working directory to a temporary path to help isolate the test suite."""
+    """Change the working directory to a temporary path to help isolate the test suite.
+
+    The CLI resolves `servo.yaml` and `.env` relative to the working directory and
+    pydantic settings read `.env` from it, so the change cannot be replaced by
+    passing explicit paths around.
+    """
     os.chdir(tmp_path)
 
 
@@ -438,9 +407,8 @@ def clean_environment() -> Callable[[None], None]:
     """
 
     def _clean_environment():
-        for key, value in os.environ.copy().items():
-            if key.startswith("SERVO_") or key.startswith("OPSANI_"):
-                os.environ.pop(key)
+        for key in [k for k in os.environ if k.startswith(("SERVO_", "OPSANI_"))]:
+            os.environ.pop(key)
 
     _clean_environment()
     return _clean_environment
@@ -449,8 +417,7 @@ def clean_environment() -> Callable[[None], None]:
 @pytest.fixture
 def random_string() -> str:
     """Return a random string of characters."""
-    letters = string.ascii_letters
-    return "".join(random.choice(letters) for i in range(32))
+    return "".join(random.choices(string.ascii_letters, k=32))
 
 
 @pytest.fixture
@@ -478,6 +445,12 @@ def kubeconfig(request) -> Union[pathlib.Path, pathlib.PurePath]:
     return retval
 
 
+# Loaded kubernetes_asyncio client configurations keyed by kubeconfig file, modification time, and context
+kube_client_configs: Dict[
+    Tuple[str, Optional[int], Optional[str]], "kubernetes_asyncio.client.Configuration"
+] = {}
+
+
 @pytest.fixture
 async def kubernetes_asyncio_config(
     request, kubeconfig: str, kubecontext: Optional[str]
@@ -485,6 +458,7 @@ async def kubernetes_asyncio_config(
     """Initialize the kubernetes_asyncio config module with the kubeconfig fixture path."""
     import logging
 
+    import kubernetes_asyncio.client
     import kubernetes_asyncio.config
 
     if request.session.config.getoption("in_cluster") or os.getenv(
@@ -495,9 +469,26 @@ async def kubernetes_asyncio_config(
         kubeconfig = kubeconfig or os.getenv("KUBECONFIG")
         if kubeconfig:
             kubeconfig_path = pathlib.Path(os.path.expanduser(kubeconfig))
-            await kubernetes_asyncio.config.load_kube_config(
-                config_file=os.path.expandvars(kubeconfig_path),
-                context=kubecontext,
+            config_file = os.path.expandvars(kubeconfig_path)
+
+            # NOTE: Parse the kubeconfig once unless the file has been rewritten (e.g. by minikube)
+            mtime = (
+                os.stat(config_file).st_mtime_ns
+                if os.path.exists(config_file)
+                else None
+            )
+            key = (config_file, mtime, kubecontext)
+            if key not in kube_client_configs:
+                await kubernetes_asyncio.config.load_kube_config(
+                    config_file=config_file,
+                    context=kubecontext,
+                )
+                kube_client_configs[
+                    key
+                ] = kubernetes_asyncio.client.Configuration.get_default_copy()
+
+            kubernetes_asyncio.client.Configuration.set_default(
+                kube_client_configs[key]
             )
         else:
             log = logging.getLogger("kubetest")
@@ -593,6 +584,9 @@ async def fakeapi_url(
     fastapi_app: fastapi.FastAPI, unused_tcp_port: int
 ) -> AsyncGenerator[str, None]:
     """Run a FakeAPI server as a pytest fixture and yield the base URL for accessing it."""
+    # NOTE: The server is deliberately per test. It runs as a task on the test's
+    # event loop, and the fake optimizers mounted on the app are driven from the
+    # test body on that same loop, so a shared server would cross loops
     server = tests.helpers.FakeAPI(app=fastapi_app, port=unused_tcp_port)
     await server.start()
     yield server.base_url
@@ -600,13 +594,21 @@ async def fakeapi_url(
 
 
 @pytest.fixture
-async def fakeapi_client(fakeapi_url: str) -> AsyncIterator[httpx.AsyncClient]:
-    """Yield an httpx client configured to interact with a FakeAPI server."""
+async def fakeapi_client(
+    fastapi_app: fastapi.FastAPI,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield an httpx client configured to interact with the FakeAPI app.
+
+    Requests are dispatched to the app in process over ASGI, so no server is
+    started and no sockets are opened. Use the `fakeapi_url` fixture when the
+    code under test needs a real URL to connect to.
+    """
     async with httpx.AsyncClient(
+        app=fastapi_app,
         headers={
             "Content-Type": "application/json",
         },
-        base_url=fakeapi_url,
+        base_url="http://fakeapi",
     ) as client:
         yield client
 
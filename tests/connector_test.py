@@ -17,7 +17,7 @@ import servo as servox
 from servo import BaseConnector, Duration, License, Maturity, Optimizer, Version
 from servo.cli import ServoCLI
 from servo.configuration import BaseConfiguration, BaseServoConfiguration
-from servo.connector import _connector_subclasses
+from servo.connector import _connector_class_from_string, _connector_subclasses
 from servo.connectors.vegeta import TargetFormat, VegetaConfiguration, VegetaConnector
 from servo.events import EventContext, Preposition, _events, create_event, event
 from servo.logging import ProgressHandler, reset_to_defaults
@@ -117,6 +117,26 @@ class TestConnector:
         assert TestConnector.full_name == "Test Connector"
         assert TestConnector.__default_name__ == "test"
 
+    def test_lookup_by_name_after_rename(self) -> None:
+        class RenamedLookupConnector(BaseConnector):
+            pass
+
+        original = RenamedLookupConnector
+
+        @servox.metadata(name=("Renamed", "renamed-lookup-alias"))
+        class RenamedLookupConnector(BaseConnector):
+            pass
+
+        try:
+            assert _connector_class_from_string("renamed_lookup") is original
+            assert (
+                _connector_class_from_string("renamed-lookup-alias")
+                is RenamedLookupConnector
+            )
+        finally:
+            # Identically named settings models conflict in the assembly schema
+            _connector_subclasses.difference_update({original, RenamedLookupConnector})
+
     def test_default_version(self) -> None:
         class TestConnector(BaseConnector):
             pass
@@ -594,6 +614,12 @@ def test_vegeta_name_invalid() -> None:
     )
 
 
+def test_vegeta_name_trailing_newline_invalid() -> None:
+    config = VegetaConfiguration(rate="50/1s", target="GET http://localhost:8080")
+    with pytest.raises(ValidationError):
+        VegetaConnector(config=config, name="vegeta\n")
+
+
 def test_vegeta_name() -> None:
     assert VegetaConnector.name == "Vegeta"
 
@@ -1358,6 +1384,21 @@ class TestConnectorEvents:
             "another_example_event"
         )
 
+    def test_event_handlers_are_inherited_once(self) -> None:
+        class LeftConnector(TestConnectorEvents.FakeConnector):
+            pass
+
+        class RightConnector(TestConnectorEvents.FakeConnector):
+            pass
+
+        class DiamondConnector(LeftConnector, RightConnector):
+            pass
+
+        assert len(DiamondConnector.get_event_handlers("example_event")) == 1
+        assert len(DiamondConnector.__event_handlers__) == len(
+            TestConnectorEvents.FakeConnector.__event_handlers__
+        )
+
     async def test_event_invoke(self) -> None:
         config = BaseConfiguration.construct()
         connector = TestConnectorEvents.FakeConnector(config=config)
@@ -1368,6 +1409,7 @@ class TestConnectorEvents:
         assert result.event.name == "example_event"
         assert result.connector == connector
         assert result.value == 12345
+        assert result.handler.is_coroutine
 
     async def test_event_context_var(self) -> None:
         config = BaseConfiguration.construct()
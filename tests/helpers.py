@@ -3,9 +3,13 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import functools
+import hashlib
 import json
 import os
 import pathlib
+import re
+import subprocess
 from pathlib import Path
 from typing import (
     Any,
@@ -15,6 +19,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Type,
     Union,
 )
@@ -319,15 +324,167 @@ async def kubernetes_asyncio_client_overrides(
         kubernetes_asyncio.client.Configuration.set_default(original_config)
 
 
+# Docker image builds keyed by tag, preamble, and source tree digest
+_docker_image_builds: Dict[Tuple[str, Optional[str], str], asyncio.Future] = {}
+
+
+def _translate_dockerignore_pattern(pattern: str) -> str:
+    """Translate a .dockerignore pattern into a regular expression.
+
+    Follows Docker's matching rules: `*` and `?` do not cross path separators,
+    `**` matches any number of directories, and a pattern that matches a
+    directory also matches everything beneath it.
+    """
+    regex, index = "", 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+            continue
+        elif pattern.startswith("**", index):
+            regex += ".*"
+            index += 2
+            continue
+        elif char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            regex += pattern[index : end + 1].replace("[!", "[^", 1)
+            index = end
+        else:
+            regex += re.escape(char)
+        index += 1
+
+    return regex + "(?:/.*)?"
+
+
+def _dockerignore_patterns(
+    root_path: pathlib.Path,
+) -> List[Tuple[re.Pattern, bool]]:
+    """Return the compiled patterns of the .dockerignore file under the root path.
+
+    Each pattern is paired with a flag indicating if it is negated (`!`).
+    """
+    dockerignore_path = root_path / ".dockerignore"
+    if not dockerignore_path.exists():
+        return []
+
+    patterns = []
+    for line in dockerignore_path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        pattern = os.path.normpath(line.lstrip("!").strip()).lstrip("/")
+        patterns.append((re.compile(_translate_dockerignore_pattern(pattern)), negated))
+
+    return patterns
+
+
+@functools.lru_cache(maxsize=None)
+def source_tree_digest(root_path: pathlib.Path) -> str:
+    """Return a SHA-256 hex digest of the Docker build context of the working copy.
+
+    Files are enumerated via git so that ignored paths are skipped. Untracked
+    files are included so that work in progress invalidates the digest. Files
+    excluded by .dockerignore are skipped as they never reach the image.
+    """
+    paths = subprocess.run(
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+        cwd=root_path,
+        check=True,
+        capture_output=True,
+    ).stdout.split(b"\0")
+    patterns = _dockerignore_patterns(root_path)
+    digest = hashlib.sha256()
+    for path in sorted(filter(None, paths)):
+        name = os.fsdecode(path)
+        excluded = False
+        for pattern, negated in patterns:
+            if pattern.fullmatch(name):
+                excluded = not negated
+        if excluded:
+            continue
+
+        file_path = root_path / name
+        if file_path.is_file():
+            digest.update(path + b"\0")
+            digest.update(file_path.read_bytes())
+
+    return digest.hexdigest()
+
+
 async def build_docker_image(
-    tag: str = "opsani/servox:edge",
+    tag: Optional[str] = None,
     *,
     preamble: Optional[str] = None,
     print_output: bool = True,
     **kwargs,
 ) -> str:
+    """Build a Docker image from the working copy and return its tag.
+
+    When no tag is given, the image is tagged with a digest of the source tree
+    and an existing image with that tag is reused without rebuilding.
+
+    Builds are memoized for the life of the process so that identical builds
+    are only run once. Concurrent requests for the same build share it.
+    """
     root_path = pathlib.Path(__file__).parents[1]
+    digest = source_tree_digest(root_path)
+    reuse_existing = tag is None
+    tag = tag or f"servox:test-{digest[:16]}"
+    key = (tag, preamble, digest)
+
+    # NOTE: A pending build belonging to another (closed) event loop is abandoned
+    build = _docker_image_builds.get(key)
+    if build is None or not (
+        build.done() or build.get_loop() is asyncio.get_running_loop()
+    ):
+        build = asyncio.ensure_future(
+            _build_docker_image(
+                tag,
+                root_path,
+                preamble=preamble,
+                print_output=print_output,
+                reuse_existing=reuse_existing,
+                **kwargs,
+            )
+        )
+        _docker_image_builds[key] = build
+
+    try:
+        return await build
+    except Exception:
+        # Let the next caller retry a failed build
+        if _docker_image_builds.get(key) is build:
+            del _docker_image_builds[key]
+        raise
+
+
+async def _build_docker_image(
+    tag: str,
+    root_path: pathlib.Path,
+    *,
+    preamble: Optional[str],
+    print_output: bool,
+    reuse_existing: bool,
+    **kwargs,
+) -> str:
     subprocess = Subprocess()
+    if reuse_existing:
+        # Content addressed tags are immutable so an existing image is current
+        exit_code, _, _ = await subprocess(
+            f"{preamble or 'true'} && docker image inspect {tag}",
+            print_output=False,
+            **kwargs,
+        )
+        if exit_code == 0:
+            return tag
+
     exit_code, stdout, stderr = await subprocess(
         f"{preamble or 'true'} && DOCKER_BUILDKIT=1 docker build -t {tag} --build-arg BUILDKIT_INLINE_CACHE=1 --cache-from opsani/servox:edge {root_path}",
         print_output=print_output,
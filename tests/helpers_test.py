@@ -0,0 +1,63 @@
+import pathlib
+import subprocess
+from typing import Iterator
+
+import pytest
+
+from tests.helpers import source_tree_digest
+
+
+@pytest.fixture
+def source_tree(tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    tmp_path.joinpath(".dockerignore").write_text("*.log\ndocs\nlogs\ntests/\n")
+    tmp_path.joinpath("Dockerfile").write_text("FROM python:3.9-slim\nCOPY . ./\n")
+    for path in ("servo/__init__.py", "tests/servo_test.py", "docs/index.md"):
+        tmp_path.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(path).write_text("")
+    tmp_path.joinpath("logs").mkdir()
+    tmp_path.joinpath("logs", "servo.log").write_text("")
+
+    source_tree_digest.cache_clear()
+    yield tmp_path
+    source_tree_digest.cache_clear()
+
+
+def test_source_tree_digest_ignores_log_output(source_tree: pathlib.Path) -> None:
+    digest = source_tree_digest(source_tree)
+    source_tree_digest.cache_clear()
+    with source_tree.joinpath("logs", "servo.log").open("a") as log:
+        log.write("INFO | servo | Log line written during a test session\n")
+    source_tree.joinpath("build.log").write_text("Step 1/2 : FROM python:3.9-slim\n")
+
+    assert source_tree_digest(source_tree) == digest
+
+
+def test_source_tree_digest_ignores_files_outside_build_context(
+    source_tree: pathlib.Path,
+) -> None:
+    digest = source_tree_digest(source_tree)
+    source_tree_digest.cache_clear()
+    source_tree.joinpath("tests", "servo_test.py").write_text("assert True\n")
+    source_tree.joinpath("docs", "index.md").write_text("# Servo\n")
+
+    assert source_tree_digest(source_tree) == digest
+
+
+def test_source_tree_digest_tracks_build_context(source_tree: pathlib.Path) -> None:
+    digest = source_tree_digest(source_tree)
+    source_tree_digest.cache_clear()
+    source_tree.joinpath("servo", "__init__.py").write_text("__version__ = '0'\n")
+
+    assert source_tree_digest(source_tree) != digest
+
+
+def test_source_tree_digest_honors_negated_patterns(
+    source_tree: pathlib.Path,
+) -> None:
+    source_tree.joinpath(".dockerignore").write_text("docs\n!docs/index.md\n")
+    digest = source_tree_digest(source_tree)
+    source_tree_digest.cache_clear()
+    source_tree.joinpath("docs", "index.md").write_text("# Servo\n")
+
+    assert source_tree_digest(source_tree) != digest
@@ -105,6 +105,12 @@ class SecondTestServoConnector(BaseConnector):
     def this_is_an_event(self) -> str:
         return "this is a different result"
 
+    @before_event(Events.measure)
+    def prepare_to_measure(
+        self, metrics: List[str] = [], control: Control = Control()
+    ) -> None:
+        pass
+
     @event(handler=True)
     async def another_event(self) -> None:
         pass
@@ -283,6 +289,55 @@ async def test_cancellation_of_event_from_before_handler(mocker, servo: servo):
     )
 
 
+async def test_cancellation_of_event_from_multiple_before_handlers(
+    mocker, servo: servo
+):
+    first_handler, second_handler = (
+        servo.get_connector(name).get_event_handlers("measure", Preposition.before)[0]
+        for name in ("first_test_servo", "second_test_servo")
+    )
+
+    messages = []
+    servo.logger.add(lambda m: messages.append(m), level=0)
+
+    first_mock = mocker.patch.object(first_handler, "handler")
+    first_mock.side_effect = EventCancelledError("first")
+    second_mock = mocker.patch.object(second_handler, "handler")
+    second_mock.side_effect = EventCancelledError("second")
+    results = await servo.dispatch_event("measure")
+
+    # Both handlers run but the first connector in order wins
+    first_mock.assert_called_once()
+    second_mock.assert_called_once()
+    assert results == []
+    warnings = [m for m in messages if m.record["level"].name == "WARNING"]
+    assert len(warnings) == 1
+    assert (
+        warnings[0].record["message"]
+        == 'event cancelled by before event handler on connector "first_test_servo": first'
+    )
+
+
+async def test_first_error_from_multiple_before_handlers_is_raised(
+    mocker, servo: servo
+):
+    first_handler, second_handler = (
+        servo.get_connector(name).get_event_handlers("measure", Preposition.before)[0]
+        for name in ("first_test_servo", "second_test_servo")
+    )
+
+    first_mock = mocker.patch.object(first_handler, "handler")
+    first_mock.side_effect = EventError("first")
+    second_mock = mocker.patch.object(second_handler, "handler")
+    second_mock.side_effect = RuntimeError("second")
+    with pytest.raises(EventError, match="first"):
+        await servo.dispatch_event("measure")
+
+    # Both handlers run before the error surfaces
+    first_mock.assert_called_once()
+    second_mock.assert_called_once()
+
+
 async def test_cannot_cancel_from_on_handlers_warning(mocker, servo: servo):
     connector = servo.get_connector("first_test_servo")
     event_handler = connector.get_event_handlers("promote", Preposition.on)[0]
@@ -1613,7 +1668,7 @@ class TestServoSettings:
     def test_connectors_rejects_invalid_connector_set_class_name_elements(self):
         with pytest.raises(ValidationError) as e:
             BaseServoConfiguration(
-                connectors={"servo.servo.BaseServoConfiguration"},
+                connectors={"servo.configuration.BaseServoConfiguration"},
             )
         assert "1 validation error for BaseServoConfiguration" in str(e.value)
         assert e.value.errors()[0]["loc"] == ("connectors",)
@@ -1845,6 +1900,19 @@ def test_api_client_options() -> None:
     }.items() <= servo.api_client_options.items()
 
 
+def test_api_headers_are_reused_until_token_changes() -> None:
+    optimizer = Optimizer(id="test.com/foo", token="12345")
+    servo = Servo(config={"optimizer": optimizer}, connectors=[])
+
+    headers = servo.api_headers
+    assert headers["Authorization"] == "Bearer 12345"
+    assert servo.api_client_options["headers"] is headers
+
+    servo.optimizer.token = "67890"
+    assert servo.api_headers is not headers
+    assert servo.api_headers["Authorization"] == "Bearer 67890"
+
+
 async def test_models() -> None:
     optimizer = Optimizer(id="test.com/foo", token="12345")
     config = CommonConfiguration(proxies="http://localhost:1234", ssl_verify=False)
@@ -6,14 +6,12 @@ import tests.helpers
 
 
 @pytest.fixture
-async def servo_image(request) -> str:
-    """Asynchronously build a Docker image from the current working copy and return its tag."""
-    image_key = f"servo_image/{os.getpid()}"
-    image = request.config.cache.get(image_key, None)
-    if image is None:
-        image = await tests.helpers.build_docker_image()
-        request.config.cache.set(image_key, image)
-    return image
+async def servo_image() -> str:
+    """Asynchronously build a Docker image from the current working copy and return its tag.
+
+    The image is built once per test session and reused by subsequent tests.
+    """
+    return await tests.helpers.build_docker_image()
 
 
 @pytest.fixture